@@ -17,6 +17,10 @@ COLUMN_NAMES = ["seqid",
                 "attributes"]
 
 
+# Set of column names for membership tests against feature fields
+_COLUMN_NAME_SET = frozenset(COLUMN_NAMES)
+
+
 def parse_feature(string):
     """
     Parses a feature (line) of a gff3 file.
@@ -29,20 +33,14 @@ def parse_feature(string):
     :return: dictionary of key value pairs
     :rtype: dict[str, str]
     """
-    columns = dict(zip(COLUMN_NAMES,
-                       string.strip('\n').split()))
-    attributes = columns["attributes"].split(';')
-    attributes = {k: v for k, v in (attribute.split('=')
-                                    for attribute in attributes)}
-    del columns["attributes"]
-
-    columns = {k: decode_column(v)
-               for k, v in columns.items()}
-    attributes = {decode_attribute(k): decode_attribute(v)
-                  for k, v in attributes.items()}
-
-    dictionary = attributes
-    dictionary.update(columns)
+    fields = string.strip('\n').split()
+
+    dictionary = {}
+    for attribute in fields[8].split(';'):
+        key, value = attribute.split('=')
+        dictionary[decode_attribute(key)] = decode_attribute(value)
+    for name, value in zip(COLUMN_NAMES[0:8], fields):
+        dictionary[name] = decode_column(value)
     return dictionary
 
 
@@ -60,95 +58,177 @@ def format_feature(dictionary):
     :return: single line for a gff file
     :rtype: str
     """
-    column_values = (encode_column(str(dictionary[field]))
-                     for field in COLUMN_NAMES[0:8])
-    columns = '{0}\t{1}\t{2}\t{3}\t{4}\t{5}\t{6}\t{7}\t'
-    columns = columns.format(*column_values)
-
-    attribute_names = [field for field in dictionary.keys()
-                       if field not in COLUMN_NAMES]
-    attribute_names.sort()
-    attributes_pairs = ((encode_attribute(str(field)),
-                         encode_attribute(str(dictionary[field])))
-                        for field in attribute_names)
+    columns = '\t'.join(encode_column(str(dictionary[field]))
+                        for field in COLUMN_NAMES[0:8])
 
-    attributes = ':'.join('{}={}'.format(field, value)
-                          for field, value in attributes_pairs)
+    attribute_names = sorted(field for field in dictionary
+                             if field not in _COLUMN_NAME_SET)
+    attributes = ':'.join('{0}={1}'.format(
+        encode_attribute(str(field)),
+        encode_attribute(str(dictionary[field])))
+                          for field in attribute_names)
 
-    return columns + attributes
+    return columns + '\t' + attributes
 
 
-def _eq(x, y):
+def _compile_eq(value):
     """
-    Tests a pair of strings for equivalence by attempting to convert
-    them to floats and falling back to string comparison.
+    Compile an equivalence test against a fixed string value.
 
-    :param x: string
-    :type x: str
-    :param y: string
-    :type y: str
+    The value is coerced to a float once at compile time so numeric
+    comparisons do not re-parse it per feature. Comparison falls back
+    to string equivalence for non-numeric pairs.
 
-    :return: boolean
-    :rtype: bool
+    :param value: string
+    :type value: str
+
+    :return: a single argument predicate
+    :rtype: callable
     """
     try:
-        return float(x) == float(y)
+        number = float(value)
     except ValueError:
-        return x == y
+        return lambda x: x == value
+
+    def _test(x):
+        try:
+            return float(x) == number
+        except ValueError:
+            return x == value
+    return _test
 
 
-def _neq(x, y):
+def _compile_neq(value):
     """
-    Tests a pair of strings for non-equivalence by attempting to convert
-    them to floats and falling back to string comparison.
+    Compile a non-equivalence test against a fixed string value.
 
-    :param x: string
-    :type x: str
-    :param y: string
-    :type y: str
+    The value is coerced to a float once at compile time so numeric
+    comparisons do not re-parse it per feature. Comparison falls back
+    to string non-equivalence for non-numeric pairs.
 
-    :return: boolean
-    :rtype: bool
+    :param value: string
+    :type value: str
+
+    :return: a single argument predicate
+    :rtype: callable
     """
     try:
-        return float(x) != float(y)
+        number = float(value)
     except ValueError:
-        return x != y
+        return lambda x: x != value
 
+    def _test(x):
+        try:
+            return float(x) != number
+        except ValueError:
+            return x != value
+    return _test
 
-# Function dispatch based on operator passed as string
-_OPERATOR_DISPATCH = {'==': _eq,
-                      '=': _eq,
-                      '!=': _neq,
-                      '>=': lambda x, y: float(x) >= float(y),
-                      '>': lambda x, y: float(x) > float(y),
-                      '<=': lambda x, y: float(x) <= float(y),
-                      '<': lambda x, y: float(x) < float(y)}
+
+def _compile_gte(value):
+    """Compile a numeric >= test against a fixed value."""
+    number = float(value)
+    return lambda x: float(x) >= number
+
+
+def _compile_gt(value):
+    """Compile a numeric > test against a fixed value."""
+    number = float(value)
+    return lambda x: float(x) > number
+
+
+def _compile_lte(value):
+    """Compile a numeric <= test against a fixed value."""
+    number = float(value)
+    return lambda x: float(x) <= number
+
+
+def _compile_lt(value):
+    """Compile a numeric < test against a fixed value."""
+    number = float(value)
+    return lambda x: float(x) < number
+
+
+def _compile_field_match(field):
+    """
+    Compile a function returning the feature fields matched by a
+    filter field.
+
+    Filter fields without wildcard characters are matched by direct
+    dictionary lookup. Wildcard fields are matched with a regex
+    compiled once from the pattern rather than fnmatch-ing every
+    feature key per feature.
+
+    :param field: filter field, optionally with wildcards
+    :type field: str
+
+    :return: a function returning the matching fields of a feature
+    :rtype: callable
+    """
+    if not any(character in field for character in '*?['):
+        def _match(feature):
+            return [field] if field in feature else []
+        return _match
+
+    pattern = re.compile(fnmatch.translate(field))
+
+    def _match(feature):
+        return [key for key in feature if pattern.match(key)]
+    return _match
+
+
+# Pattern matching the operator of a filter string
+_OPERATOR_PATTERN = re.compile(">=|<=|==|!=|>|<|=")
+
+
+# Test-compiler dispatch based on operator passed as string
+_OPERATOR_DISPATCH = {'==': _compile_eq,
+                      '=': _compile_eq,
+                      '!=': _compile_neq,
+                      '>=': _compile_gte,
+                      '>': _compile_gt,
+                      '<=': _compile_lte,
+                      '<': _compile_lt}
 
 
 def parse_filter_string(string):
     """
     Parse a filter string into a 'field' 'operator' and 'value'
 
+    The operator and value are additionally compiled into a single
+    argument predicate stored under 'test', and the field into a
+    feature-field matcher stored under 'match'.
+
     :param string: stirng with format "<field><operator><value>"
     :type string: str
 
-    :return: dictionary with fields 'field' 'operator' and 'value'
-    :rtype: dict[str, str]
+    :return: dictionary with fields 'field', 'operator', 'value',
+        'match' and 'test'
+    :rtype: dict[str, str | callable]
     """
-    operator = re.findall(">=|<=|==|!=|>|<|=", string)
-    if len(operator) > 1:
-        message = 'There is more than one operator in filter: "{0}"'
-        raise ValueError(message.format(string))
-    elif len(operator) < 1:
+    matches = _OPERATOR_PATTERN.finditer(string)
+    match = next(matches, None)
+    if match is None:
         message = 'Could not find a valid operator in filter: "{0}"'
         raise ValueError(message.format(string))
+    elif next(matches, None) is not None:
+        message = 'There is more than one operator in filter: "{0}"'
+        raise ValueError(message.format(string))
     else:
-        operator = operator[0]
-        field, value = string.split(operator)
-        field = field.strip()
-        value = value.strip()
-        return {'field': field, 'operator': operator, 'value': value}
+        operator = match.group()
+        field = string[:match.start()].strip()
+        value = string[match.end():].strip()
+        try:
+            test = _OPERATOR_DISPATCH[operator](value)
+        except ValueError:
+            message = 'Operator "{0}" requires a numeric value ' \
+                      'in filter: "{1}"'
+            raise ValueError(message.format(operator, string))
+        return {'field': field,
+                'operator': operator,
+                'value': value,
+                'match': _compile_field_match(field),
+                'test': test}
 
 
 def apply_filter(feature, filter_, combinator):
@@ -171,16 +251,14 @@ def apply_filter(feature, filter_, combinator):
     :return: boolean indicating if the feature matches the filter.
     :rtype: bool
     """
-    fields = fnmatch.filter(list(feature.keys()), filter_['field'])
-    results = [_OPERATOR_DISPATCH[filter_['operator']](feature[field],
-                                                       filter_['value'])
-               for field in fields]
-    if results == []:
+    fields = filter_['match'](feature)
+    if not fields:
         return False  # if there are no fields to match
-    elif combinator == 'ANY':
-        return any(results)
+    test = filter_['test']
+    if combinator == 'ANY':
+        return any(test(feature[field]) for field in fields)
     elif combinator == 'ALL':
-        return all(results)
+        return all(test(feature[field]) for field in fields)
     else:
         assert False
 
@@ -201,10 +279,11 @@ def apply_filters(feature, filters, combinator):
     :return: boolean indicating if the feature matches the combined filters.
     :rtype: bool
     """
-    results = [apply_filter(feature, filt, combinator) for filt in filters]
     if combinator == 'ANY':
-        return any(results)
+        return any(apply_filter(feature, filt, combinator)
+                   for filt in filters)
     elif combinator == 'ALL':
-        return all(results)
+        return all(apply_filter(feature, filt, combinator)
+                   for filt in filters)
     else:
         assert False
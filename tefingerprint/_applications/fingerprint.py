@@ -2,7 +2,6 @@
 
 import numpy as np
 from itertools import product
-from functools import reduce
 from collections import Counter
 from multiprocessing import Pool
 from tefingerprint import util
@@ -83,13 +82,18 @@ def fingerprint(bams,
     else:
         # create a pool of processes
         with Pool(cores) as pool:
-            parts = pool.starmap(_fingerprint_dispatch, jobs)
+            parts = pool.imap_unordered(_fingerprint_dispatch_star, jobs)
             for part in parts:
                 result.update(part.contigs())
 
     return result
 
 
+def _fingerprint_dispatch_star(job):
+    """dispatch a single job of a fingerprint from a tuple of arguments"""
+    return _fingerprint_dispatch(*job)
+
+
 def _fingerprint_dispatch(bams,
                           annotation,
                           categories,
@@ -283,19 +287,27 @@ def count_reads(clusters, reads, trim=True, n_common_elements=0):
                 for j in range(n_common_elements):
                     bin_contig.loci['sample'][str(i)]['element'][str(j)] = ('.', 0)
 
+        # sort each read set by tip position so that reads contained
+        # in a bin form a contiguous slice and cache the tip column to
+        # avoid re-slicing the structured field for every bin
+        sorted_reads = []
+        for header in read_headers:
+            data = reads[header].loci[np.argsort(reads[header].loci['tip'],
+                                                 kind='stable')]
+            sorted_reads.append((data['tip'], data))
+
         # iterate through bins
         for locus in bin_contig.loci:
 
-            # boolean masks of contained reads for each read set
-            read_masks = [np.logical_and(reads[header].loci['tip'] >=
-                                         locus['start'],
-                                         reads[header].loci['tip'] <=
-                                         locus['stop'])
-                          for header in read_headers]
-
             # read loci data of contained reads for each read set
-            read_loci = [reads[header].loci[mask]
-                         for header, mask in zip(read_headers, read_masks)]
+            # found by bisection of the sorted tips
+            read_loci = [data[np.searchsorted(tips,
+                                              locus['start'],
+                                              side='left'):
+                              np.searchsorted(tips,
+                                              locus['stop'],
+                                              side='right')]
+                         for tips, data in sorted_reads]
 
             # counts of reads
             for i, r in enumerate(read_loci):
@@ -311,8 +323,8 @@ def count_reads(clusters, reads, trim=True, n_common_elements=0):
                         locus['sample'][str(i)]['element'][str(j)] = pair
 
             # find median of cluster
-            combined_read_tips = reduce(np.append,
-                                        (tips['tip'] for tips in read_loci))
+            combined_read_tips = np.concatenate([tips['tip']
+                                                 for tips in read_loci])
             combined_read_tips.sort()
             locus['median'] = np.median(combined_read_tips)
 
@@ -485,7 +497,7 @@ def _cluster_pairer(forward, reverse, distance=0, use_known_elements=True):
     r['strand'] = '-'
     r['index'] = np.arange(0, len(reverse))
 
-    clusters = np.append(f, r)
+    clusters = np.concatenate((f, r))
     clusters.sort(order=('median', 'strand'))
 
     prev = None
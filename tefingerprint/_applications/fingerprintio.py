@@ -42,40 +42,60 @@ def extract_references_from_bams(*args):
     return reference_lists[0]
 
 
-def _extract_bam_read_data(bam, reference, quality=0, tags=None):
+def _extract_bam_read_data(bam, reference, quality=0, tag='ME'):
     """
-    Extract and parse read data from a single reference of a
-    single bam file.
+    Extract and parse informative read tips from a single reference
+    of a single bam file.
 
-    Read positions are returned in sam format (one-based inclusive).
+    Read tip positions are returned in sam format (one-based inclusive).
     Only extracts reads aligned to the specified reference.
 
-
     :param bam: Path to a bam file
     :type bam: str
     :param reference: Name of reference
     :type reference: str
     :param quality: Minimum mapping quality of reads
     :type quality: int
-    :param tags: List of sam tags to include in output
-    :type tags: list[str]
+    :param tag: Sam tag containing each reads mate element name
+    :type tag: str
 
-    :return: iterable of dictionaries containing read metadata
-    :rtype: iterable[dict]
+    :return: iterable of tuples of strand, tip position and element name
+    :rtype: iterable[(str, int, str)]
+    """
+    with pysam.AlignmentFile(bam, 'rb') as alignment:
+        for read in alignment.fetch(region=reference):
+            if read.mapping_quality >= quality:
+                if read.is_reverse:
+                    # adjust for pysam indexing
+                    yield '-', read.reference_start + 1, read.get_tag(tag)
+                else:
+                    yield '+', read.reference_end, read.get_tag(tag)
+
+
+def _category_matcher(categories):
+    """
+    Compile a function matching element names to the longest matching
+    category.
+
+    Categories are constant for a whole extraction job so the
+    length-descending ordering is computed once rather than per record.
+
+    :param categories: Name(s) of one or more transposon (super-)families
+    :type categories: list[str]
+
+    :return: a function returning the longest matching category of a
+        name or None
+    :rtype: callable
     """
-    gen = pysam.AlignmentFile(bam, 'rb')
-    for read in gen.fetch(region=reference):
-        if read.mapping_quality >= quality:
-            data = {
-                'reference': reference.split(':')[0],
-                'strand': '-' if read.is_reverse else '+',
-                'start': read.blocks[0][0] + 1,  # adjust for pysam indexing
-                'stop': read.blocks[-1][-1],
-                'source': os.path.basename(bam)
-            }
-            if tags is not None:
-                data.update({tag: read.get_tag(tag) for tag in tags})
-            yield data
+    categories = sorted(categories, key=len, reverse=True)
+
+    def match(name):
+        for category in categories:
+            if name.startswith(category):
+                return category
+        return None
+
+    return match
 
 
 def extract_informative_read_tips(bams,
@@ -121,42 +141,56 @@ def extract_informative_read_tips(bams,
                    ['+', '-'],
                    categories,
                    [os.path.basename(bam) for bam in bams])
-    dictionary = {loci.Header(*key): deque() for key in keys}
+
+    # parallel queues of tip positions and element names per header
+    dictionary = {loci.Header(*key): (deque(), deque()) for key in keys}
+
+    match_category = _category_matcher(categories)
 
     for bam in bams:
+        source = os.path.basename(bam)
         for reference in references:
-            for read in _extract_bam_read_data(bam,
-                                               reference,
-                                               quality=quality,
-                                               tags=[tag]):
+            reference_name = reference.split(':')[0]
+            for strand, tip, element in _extract_bam_read_data(bam,
+                                                               reference,
+                                                               quality=quality,
+                                                               tag=tag):
 
-                # match to a category
-                category_matches = tuple(filter(lambda x:
-                                                read[tag].startswith(x),
-                                                categories))
+                # longest matching category is the best category
+                category = match_category(element)
 
                 # only include reads for specified categories
-                if category_matches:
-
-                    # longest matching category is the best category
-                    category = max(category_matches, key=len)
+                if category is not None:
 
                     # read header
-                    header = loci.Header(reference=read['reference'],
-                                         strand=read['strand'],
+                    header = loci.Header(reference=reference_name,
+                                         strand=strand,
                                          category=category,
-                                         source=read['source'])
+                                         source=source)
 
-                    # append loci data to que
-                    tip = read['start'] if \
-                        read['strand'] == '-' else \
-                        read['stop']
-                    dictionary[header].append((tip, read[tag]))
+                    # append loci data to ques
+                    ques = dictionary[header]
+                    ques[0].append(tip)
+                    ques[1].append(element)
 
     dtype = np.dtype([('tip', np.int64), ('element', 'O')])
-    return loci.ContigSet(*(loci.Contig(header, np.array(data,
-                                                         dtype=dtype))
-                            for header, data in dictionary.items()))
+
+    def _as_array(tips, elements):
+        """assemble the structured array column-wise"""
+        array = np.empty(len(tips), dtype=dtype)
+        if tips:
+            array['tip'] = tips
+            array['element'] = elements
+        return array
+
+    return loci.ContigSet(*(loci.Contig(header, _as_array(*ques))
+                            for header, ques in dictionary.items()))
+
+
+# sam flag bits distinguishing anchor reads: a forward mapped first-in-pair
+# read whose mate is mapped in reverse orientation
+_ANCHOR_FLAG_MASK = 0x1 | 0x4 | 0x8 | 0x10 | 0x20 | 0x40
+_ANCHOR_FLAG_BITS = 0x1 | 0x20 | 0x40
 
 
 def _extract_bam_anchor_insert_data(bam, reference, quality=0):
@@ -176,16 +210,11 @@ def _extract_bam_anchor_insert_data(bam, reference, quality=0):
     """
     with pysam.AlignmentFile(bam, 'rb') as bam:
         for r in bam.fetch(region=reference):
-            if not r.is_reverse \
-                    and not r.is_unmapped \
-                    and r.is_paired \
-                    and r.is_read1 \
-                    and r.mate_is_reverse \
-                    and not r.mate_is_unmapped \
+            if r.flag & _ANCHOR_FLAG_MASK == _ANCHOR_FLAG_BITS \
                     and r.reference_id == r.next_reference_id \
                     and r.mapping_quality >= quality \
-                    and r.mpos > r.blocks[-1][-1]:
-                yield r.blocks[-1][-1], r.mpos + 1
+                    and r.mpos > r.reference_end:
+                yield r.reference_end, r.mpos + 1
 
 
 def extract_anchor_intervals(bams,
@@ -303,25 +332,23 @@ def extract_gff_intervals(gff, references, categories):
                               category=key[1],
                               source=source): deque() for key in keys}
 
+    reference_set = frozenset(references)
+    match_category = _category_matcher(categories)
+
     with zopen(gff, 'rb') as infile:
         for line in infile:
             line = line.decode().split('\t')
 
             # match to reference:
             reference = decode_column(line[0])
-            if reference in references:
+            if reference in reference_set:
 
-                # match to a category
+                # longest matching category is the best category
                 feature_type = decode_column(line[2])
-                category_matches = tuple(filter(lambda x:
-                                                feature_type.startswith(x),
-                                                categories))
+                category = match_category(feature_type)
 
                 # only include reads for specified categories
-                if category_matches:
-
-                    # longest matching category is the best category
-                    category = max(category_matches, key=len)
+                if category is not None:
 
                     header = loci.Header(reference=reference,
                                          category=category,
@@ -2,6 +2,7 @@
 
 import warnings
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 
 
 def core_distances(array, min_points):
@@ -23,13 +24,16 @@ def core_distances(array, min_points):
     # offset for indexing because the minimum points includes itself
     offset = min_points - 1
     length = len(array)
-    lower = array[0:length - offset]
-    upper = array[offset:length]
-    eps_values = upper - lower
-    eps_2d = np.full((min_points, length), np.max(eps_values), dtype=int)
-    for i in range(min_points):
-        eps_2d[i, i:length - (offset - i)] = eps_values
-    return np.min(eps_2d, axis=0)
+    eps_values = array[offset:] - array[:-offset]
+
+    # rolling minimum of eps values over every window of subclusters
+    # covering each point, padded at both ends so that edge points
+    # only see the windows that exist
+    padded = np.full(len(eps_values) + 2 * offset,
+                     np.max(eps_values),
+                     dtype=int)
+    padded[offset:offset + len(eps_values)] = eps_values
+    return sliding_window_view(padded, min_points).min(axis=-1)
 
 
 class DBICAN(object):
@@ -73,7 +77,13 @@ class DBICAN(object):
         :return: True if array is sorted in ascending order
         :rtype: bool
         """
-        return np.sum(array[1:] - array[:-1] < 0) == 0
+        # scan in blocks so an unsorted prefix fails fast without
+        # allocating a difference buffer for the whole array
+        for start in range(0, len(array) - 1, 4096):
+            block = array[start:start + 4097]
+            if np.any(block[1:] < block[:-1]):
+                return False
+        return True
 
     @staticmethod
     def _melt_slices(slices):
@@ -91,26 +101,15 @@ class DBICAN(object):
         lowers, uppers = slices['lower'], slices['upper']
         lowers.sort()
         uppers.sort()
-        splits = np.append(np.array([False]),
-                           uppers[:-1] <= lowers[1:])  # True means gap between
-
-        def _melter(lowers, uppers, splits):
-            l = lowers[0]
-            u = uppers[0]
-            for i in range(1, len(lowers)):
-                if splits[i]:
-                    # there is a gap so yield slice and start new one
-                    yield l, u
-                    l, u = slices['lower'][i], slices['upper'][i]
-                else:
-                    # no gap so merge slices
-                    u = uppers[i]
-            # yield final slice
-            yield l, u
-
-        # return slices formatted as a numpy array
-        return np.fromiter(_melter(lowers, uppers, splits),
-                           dtype=DBICAN._DTYPE_SLICE)
+
+        # with both bounds sorted a new slice begins at every lower
+        # bound not covered by the preceding (half-open) upper bound
+        splits = np.flatnonzero(uppers[:-1] <= lowers[1:])
+
+        melted = np.empty(len(splits) + 1, dtype=DBICAN._DTYPE_SLICE)
+        melted['lower'] = lowers[np.insert(splits + 1, 0, 0)]
+        melted['upper'] = uppers[np.append(splits, len(uppers) - 1)]
+        return melted
 
     @staticmethod
     def _subcluster(array, min_points, epsilon):
@@ -139,10 +138,11 @@ class DBICAN(object):
         upper = array[offset:]
         lower = array[:-offset]
         selected = upper - lower <= epsilon
-        lower_index = np.arange(0, len(lower))[selected]
-        upper_index = np.arange(offset, len(array))[selected] + 1
-        return np.fromiter(zip(lower_index, upper_index),
-                           dtype=DBICAN._DTYPE_SLICE)
+        lower_index = np.flatnonzero(selected)
+        slices = np.empty(len(lower_index), dtype=DBICAN._DTYPE_SLICE)
+        slices['lower'] = lower_index
+        slices['upper'] = lower_index + min_points
+        return slices
 
     @staticmethod
     def _cluster(array, min_points, epsilon):
@@ -241,8 +241,21 @@ class DBICAN(object):
         :rtype: :class:`numpy.ndarray`[int]
         """
         labels = np.full(len(self.input_array), -1, int)
-        for i, (lower, upper) in enumerate(self.slices):
-            labels[lower:upper] += (i + 1)
+        if len(self.slices) == 0:
+            return labels
+        # slices are sorted and non-overlapping so the cluster that
+        # may contain each point is found by bisecting the (half-open)
+        # upper bounds, then checking the point against the matching
+        # lower bound
+        positions = np.arange(len(labels))
+        candidates = np.minimum(np.searchsorted(self.slices['upper'],
+                                                positions,
+                                                side='right'),
+                                len(self.slices) - 1)
+        clustered = np.logical_and(
+            self.slices['lower'][candidates] <= positions,
+            positions < self.slices['upper'][candidates])
+        labels[clustered] = candidates[clustered]
         return labels
 
 
@@ -367,14 +380,15 @@ class SDBICAN(DBICAN):
 
         offset = min_points - 1
 
-        # calculate split eps using the 2d method
+        # calculate split eps as a rolling minimum of the eps values,
+        # padded at both ends so that edge gaps only see the windows
+        # that exist
         eps_values = array[offset:] - array[:-offset]
-        eps_2d = np.full((offset, len(eps_values) + offset - 1),
+        padded = np.full(len(eps_values) + 2 * (offset - 1),
                          np.max(eps_values),
                          dtype=int)
-        for i in range(offset):
-            eps_2d[i, i:len(eps_values) + i] = eps_values
-        splits = np.min(eps_2d, axis=0)
+        padded[offset - 1:offset - 1 + len(eps_values)] = eps_values
+        splits = sliding_window_view(padded, offset).min(axis=-1)
 
         # Remove plateaus
         gradients = splits[1:] - splits[:-1]
@@ -410,80 +424,105 @@ class SDBICAN(DBICAN):
         :return: A flat list
         :rtype: list[any]
         """
-        if isinstance(item, list):
-            for element in item:
-                for item in SDBICAN._flatten_list(element):
-                    yield item
-        else:
-            yield item
+        stack = [item]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, list):
+                stack.extend(reversed(item))
+            else:
+                yield item
 
     def _traverse_cluster_tree(self,
-                               local_points,
-                               local_max_eps):
+                               values,
+                               core_dists,
+                               lower,
+                               upper,
+                               max_eps):
         """
-        Traverse a tree of nested density clusters and recursively
+        Traverse a tree of nested density clusters and iteratively
         identify clusters based on their area.
 
-        :param local_points: An array of points with the slots 'value',
-            'index' and 'eps
-        :type local_points: :class:`numpy.ndarray`[(int, int, int)]
-        :param local_max_eps: Maximum distance allowed in among
+        An explicit stack is used in place of recursion so that deeply
+        nested cluster trees incur neither per-node call overhead nor
+        recursion-depth limits. The stack holds (lower, upper) bounds
+        into the shared point arrays rather than per-node copies of
+        the points themselves.
+
+        :param values: point values sorted in ascending order
+        :type values: :class:`numpy.ndarray`[int]
+        :param core_dists: core distance of each point
+        :type core_dists: :class:`numpy.ndarray`[int]
+        :param lower: inclusive lower index of the root cluster
+        :type lower: int
+        :param upper: half-open upper index of the root cluster
+        :type upper: int
+        :param max_eps: Maximum distance allowed in among
             each set of n points
-        :type local_max_eps: int
-
-        :return: A nested list of upper and (half-open) indices
-            of selected clusters
-        :rtype: list[list[]]
-        """
-        # Values of epsilon bellow which the cluster forks
-        fork_epsilon = self._fork_epsilon(local_points['value'],
-                                          self.min_points)
-
-        if fork_epsilon is None:
-            # The cluster doesn't fork so it has no children
-            # Epsilon_minimum would equal the minimum of core
-            # distances but it's not needed
-            return local_points['index'][0], local_points['index'][-1] + 1
-
-        # If a cluster forks into children then it's minimum epsilon
-        # is the value at which forks
-        local_min_eps = fork_epsilon
-
-        # Compare support for cluster and its children
-        if self.aggressive_method:
-            support = np.sum(local_max_eps -
-                             np.maximum(local_min_eps,
-                                        local_points['core_dist']))
-        else:
-            support = np.sum(self.epsilon -
-                             np.maximum(local_min_eps,
-                                        local_points['core_dist']))
-
-        support_children = np.sum(np.maximum(0,
-                                             local_min_eps -
-                                             local_points['core_dist']))
-
-        if support >= support_children:
-            # Parent is supported so return slice indices
-            return local_points['index'][0], local_points['index'][-1] + 1
-
-        else:
-            # Combined support of children is larger so divide
-            # and repeat recursively:
-            # A minimum epsilon of 5 means the child clusters technically
-            # starts at epsilon 4.999...
-            # we calculate the child clusters using epsilon 4 which will
-            # produce the same clusters as 4.999...
-            child_cluster_bounds = self._cluster(local_points['value'],
-                                                 self.min_points,
-                                                 local_min_eps - 1)
-            child_points = (local_points[left:right]
-                            for left, right in child_cluster_bounds)
-            # but then use epsilon 5 as the new maximum epsilon so that
-            # support is calculated from epsilon 4.999...
-            return [self._traverse_cluster_tree(points,
-                                                local_min_eps)
-                    for points in child_points]
+        :type max_eps: int
+
+        :return: A list of paired lower and (half-open) upper indices
+            of selected clusters in depth-first order
+        :rtype: list[(int, int)]
+        """
+        selected = []
+        stack = [(lower, upper, max_eps)]
+        while stack:
+            lower, upper, local_max_eps = stack.pop()
+            local_values = values[lower:upper]
+
+            # Values of epsilon bellow which the cluster forks
+            fork_epsilon = self._fork_epsilon(local_values,
+                                              self.min_points)
+
+            if fork_epsilon is None:
+                # The cluster doesn't fork so it has no children
+                # Epsilon_minimum would equal the minimum of core
+                # distances but it's not needed
+                selected.append((lower, upper))
+                continue
+
+            # If a cluster forks into children then it's minimum epsilon
+            # is the value at which forks
+            local_min_eps = fork_epsilon
+
+            # Compare support for cluster and its children based on
+            # core distances clipped to the fork epsilon:
+            # sum(eps - max(min_eps, cd)) == n * eps - sum(max(min_eps, cd))
+            # and sum(max(0, min_eps - cd)) == sum(max(min_eps, cd) - cd)
+            # so a single clipped sum serves both reductions
+            local_core_dists = core_dists[lower:upper]
+            clipped_sum = np.sum(np.maximum(local_min_eps,
+                                            local_core_dists))
+            if self.aggressive_method:
+                support = local_max_eps * (upper - lower) - clipped_sum
+            else:
+                support = self.epsilon * (upper - lower) - clipped_sum
+
+            support_children = clipped_sum - np.sum(local_core_dists)
+
+            if support >= support_children:
+                # Parent is supported so return slice indices
+                selected.append((lower, upper))
+
+            else:
+                # Combined support of children is larger so divide
+                # and repeat on each child:
+                # A minimum epsilon of 5 means the child clusters
+                # technically starts at epsilon 4.999...
+                # we calculate the child clusters using epsilon 4 which
+                # will produce the same clusters as 4.999...
+                child_cluster_bounds = self._cluster(local_values,
+                                                     self.min_points,
+                                                     local_min_eps - 1)
+                # but then use epsilon 5 as the new maximum epsilon so
+                # that support is calculated from epsilon 4.999...
+                # children are pushed in reverse so they are traversed
+                # in ascending order
+                for left, right in child_cluster_bounds[::-1]:
+                    stack.append((lower + left,
+                                  lower + right,
+                                  local_min_eps))
+        return selected
 
     def _run(self, array):
         """
@@ -503,15 +542,10 @@ class SDBICAN(DBICAN):
             return np.array([], dtype=DBICAN._DTYPE_SLICE)
 
         else:
-            # create a structured array for tracking value, index and
-            # core distance of each individual
-            points = np.empty(len(array),
-                              dtype=np.dtype([('value', np.int64),
-                                              ('index', np.int64),
-                                              ('core_dist', np.int64)]))
-            points['value'] = array
-            points['index'] = np.arange(len(array), dtype=int)
-            points['core_dist'] = self._core_distances(array, self.min_points)
+            # track value and core distance of each individual
+            # in parallel flat arrays
+            values = array
+            core_dists = self._core_distances(array, self.min_points)
             if self.epsilon is None:
                 warnings.warn("Automatic setting of epsilon is deprecated "
                               "and may be removed in future versions. "
@@ -519,26 +553,31 @@ class SDBICAN(DBICAN):
                               DeprecationWarning)
                 # start at first fork, i.e. bellow root node
                 # as in HDBSCAN* (Campello 2015)
-                self.epsilon = self._fork_epsilon(points['value'],
+                self.epsilon = self._fork_epsilon(values,
                                                   self.min_points) - 1
             if self.min_epsilon:
                 # overwrite lower eps
-                points['core_dist'] = np.maximum(self.min_epsilon,
-                                                 points['core_dist'])
+                core_dists = np.maximum(self.min_epsilon, core_dists)
 
             # initial splits based on the specified max_eps
-            initial_cluster_bounds = self._cluster(points['value'],
+            initial_cluster_bounds = self._cluster(values,
                                                    self.min_points,
                                                    self.epsilon)
-            child_points = (points[left:right]
-                            for left, right in initial_cluster_bounds)
-
-            # recursively run on all clusters
-            clusters = [self._traverse_cluster_tree(points,
-                                                    self.epsilon)
-                        for points in child_points]
-            return np.fromiter(self._flatten_list(clusters),
-                               dtype=DBICAN._DTYPE_SLICE)
+
+            # traverse the cluster tree of each initial cluster
+            slices = []
+            for left, right in initial_cluster_bounds:
+                slices.extend(self._traverse_cluster_tree(values,
+                                                          core_dists,
+                                                          left,
+                                                          right,
+                                                          self.epsilon))
+            result = np.empty(len(slices), dtype=DBICAN._DTYPE_SLICE)
+            if slices:
+                lowers, uppers = zip(*slices)
+                result['lower'] = lowers
+                result['upper'] = uppers
+            return result
 
     def fit(self, array):
         """
@@ -221,24 +221,20 @@ def mutate_header(contig, **kwargs):
     return Contig(contig.header.mutate(**kwargs), contig.loci)
 
 
-def append(contig_x, contig_y):
+def append(*contigs):
     """
-    Append the values of two contigs that have identical headers.
+    Append the values of two or more contigs that have identical headers.
 
-    :param contig_x: a contig of loci
-    :type contig_x: :class:`Contig`
-    :param contig_y: a contig of loci
-    :type contig_y: :class:`Contig`
+    :param contigs: contigs of loci
+    :type contigs: :class:`Contig`
 
-    :return: a contig containing the loci of contig_x and contig_y
+    :return: a contig containing the loci of all given contigs
     :rtype: :class:`Contig`
     """
-    try:
-        assert contig_x.header == contig_y.header
-    except AssertionError:
+    if len({contig.header for contig in contigs}) != 1:
         raise ValueError('Contigs must have identical headers')
-    else:
-        return Contig(contig_x.header, np.append(contig_x.loci, contig_y.loci))
+    return Contig(contigs[0].header,
+                  np.concatenate([contig.loci for contig in contigs]))
 
 
 def drop_field(contig, field):
@@ -334,33 +330,6 @@ def clusters(contig,
                                              dtype=dtype))
 
 
-def _unionise(array, lower_bound, upper_bound):
-    """worker for unions function"""
-    if len(array) == 1:
-        yield array[lower_bound], array[upper_bound]
-
-    else:
-        array_starts = np.array(array[lower_bound])
-        array_stops = np.array(array[upper_bound])
-        array_starts.sort()
-        array_stops.sort()
-
-        start = array_starts[0]
-        stop = array_stops[0]
-
-        for i in range(1, len(array_starts)):
-            if array_starts[i] <= stop:
-                if array_stops[i] > stop:
-                    stop = array_stops[i]
-                else:
-                    pass
-            else:
-                yield start, stop
-                start = array_starts[i]
-                stop = array_stops[i]
-        yield start, stop
-
-
 def unions(contig, lower_bound='start', upper_bound='stop'):
     """
     Calculate interval unions among loci of a contig.
@@ -383,8 +352,17 @@ def unions(contig, lower_bound='start', upper_bound='stop'):
     if len(contig.loci) == 0:
         return Contig(contig.header, np.empty(0, dtype=dtype))
     else:
-        generator = _unionise(contig.loci, lower_bound, upper_bound)
-        return Contig(contig.header, np.fromiter(generator, dtype=dtype))
+        starts = np.sort(contig.loci[lower_bound])
+        stops = np.sort(contig.loci[upper_bound])
+
+        # with both bounds sorted a new union begins at every interval
+        # that starts beyond the preceding (inclusive) stop
+        splits = np.flatnonzero(starts[1:] > stops[:-1])
+
+        unions_ = np.empty(len(splits) + 1, dtype=dtype)
+        unions_[lower_bound] = starts[np.insert(splits + 1, 0, 0)]
+        unions_[upper_bound] = stops[np.append(splits, len(stops) - 1)]
+        return Contig(contig.header, unions_)
 
 
 def unions_buffered(contig, buffer, lower_bound='start', upper_bound='stop'):
@@ -457,16 +435,24 @@ class ContigSet(object):
         else:
             assert len({ctg.header.dtype for ctg in args}) == 1
             assert len({ctg.loci.dtype for ctg in args}) == 1
+
+            # group contigs by header so duplicates are appended with a
+            # single concatenation rather than pairwise copies
+            groups = {}
             for arg in args:
-                if arg.header in self._dict.keys():
+                if arg.header in groups:
                     if append_duplicate_headers:
-                        self._dict[arg.header] = append(self._dict[arg.header],
-                                                        arg)
+                        groups[arg.header].append(arg)
                     else:
                         message = 'More than one contig with header {0}'
                         raise ValueError(message.format(arg.header))
                 else:
-                    self._dict[arg.header] = arg
+                    groups[arg.header] = [arg]
+            for header, group in groups.items():
+                if len(group) == 1:
+                    self._dict[header] = group[0]
+                else:
+                    self._dict[header] = append(*group)
 
     def __len__(self):
         return sum(map(len, self._dict.values()))
@@ -544,12 +530,12 @@ class ContigSet(object):
         """
         self._reset_array_cache()
 
-        if len(self._dict.keys()) == 0:
+        if len(self._dict) == 0:
             pass
         else:
             assert contig.header.dtype == self.dtype_headers()
             assert contig.loci.dtype == self.dtype_loci()
-        if contig.header in self._dict.keys():
+        if contig.header in self._dict:
             if append_duplicate_headers:
                 self._dict[contig.header] = append(self._dict[contig.header],
                                                    contig)
@@ -739,6 +725,12 @@ class ContigSet(object):
 
         template = "{0}\t{1}\t{2}\t{3}\t{4}\t{5}\t{6}\t{7}\t{8}"
 
+        # attribute names and the program name are invariant across
+        # records so encode them once
+        encoded_names = [(field, util.gff3.encode_attribute(field))
+                         for field in attribute_fields]
+        program = util.gff3.encode_column(program_name)
+
         for record in self._cached_array:
             if type_field:
                 type_value = record[type_field]
@@ -746,11 +738,11 @@ class ContigSet(object):
                 type_value = '.'
 
             attributes = ';'.join(('{0}={1}'.format(
-                util.gff3.encode_attribute(field),
+                name,
                 util.gff3.encode_attribute(str(record[field])))
-                                   for field in attribute_fields))
+                                   for field, name in encoded_names))
             yield template.format(util.gff3.encode_column(record[reference_field]),
-                                  util.gff3.encode_column(program_name),
+                                  program,
                                   util.gff3.encode_column(type_value),
                                   record[start_field],
                                   record[stop_field],
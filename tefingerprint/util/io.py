@@ -3,20 +3,26 @@
 import bz2
 import gzip
 from Bio import bgzf
+import os
 import os.path
 
 
 def zopen(fname, *args, **kwargs):
     if os.path.isfile(fname):
-        f = open(fname, *args, **kwargs)
-        token = f.read(3)
-        f.seek(0)
+        # sniff the magic bytes with a raw descriptor so the file
+        # object is constructed once with the correct class rather
+        # than read, rewound and wrapped
+        fd = os.open(fname, os.O_RDONLY)
+        try:
+            token = os.read(fd, 3)
+        finally:
+            os.close(fd)
         if token == b'\x1f\x8b\x08':
-            return gzip.GzipFile(fileobj=f)
+            return gzip.open(fname, *args, **kwargs)
         elif token == b'\x42\x5a\x68':
-            return bz2.BZ2File(f)
+            return bz2.open(fname, *args, **kwargs)
         else:
-            return f
+            return open(fname, *args, **kwargs)
     else:
         if fname.endswith('.gz'):
             return bgzf.open(fname, *args, **kwargs)
@@ -27,12 +27,13 @@ def flatten_tuple(item):
     :return: A generator
     :rtype: generator[any]
     """
-    if isinstance(item, tuple):
-        for element in item:
-            for item in flatten_tuple(element):
-                yield item
-    else:
-        yield item
+    stack = [item]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, tuple):
+            stack.extend(reversed(item))
+        else:
+            yield item
 
 
 if __name__ == "__main__":
@@ -1,5 +1,6 @@
 #! /usr/bin/env python3
 
+import functools
 import numpy as np
 
 
@@ -49,10 +50,14 @@ def extract_field(dtype, field):
     return np.dtype([i for i in dtype.descr if i[0] == field])
 
 
+@functools.lru_cache(maxsize=128)
 def flatten_fields(dtype, prefix='', sep='_'):
     """
     Flatten a nested numpy dtype by appending nested field names.
 
+    Results are cached per (dtype, prefix, sep) as the same structured
+    dtypes are typically flattened repeatedly.
+
     :param dtype: a numpy dtype
     :type dtype: :class:`numpy.dtype`
     :param prefix: optional prefix
@@ -63,22 +68,17 @@ def flatten_fields(dtype, prefix='', sep='_'):
     :return: a flattened numpy dtype
     :rtype: :class:`numpy.dtype`
     """
-    def flatten_descr(item, prefix=''):
-        if isinstance(item, tuple):
-            if isinstance(item[1], list):
-                prefix += str(item[0]) + sep
-                for item in flatten_descr(item[1], prefix=prefix):
-                    yield item
-            else:
-                yield (prefix + item[0], item[1])
-        elif isinstance(item, list):
-            for element in item:
-                for item in flatten_descr(element, prefix=prefix):
-                    yield item
+    descr = []
+    stack = [(prefix, item) for item in reversed(dtype.descr)]
+    while stack:
+        item_prefix, item = stack.pop()
+        if isinstance(item[1], list):
+            nested_prefix = item_prefix + str(item[0]) + sep
+            stack.extend((nested_prefix, element)
+                         for element in reversed(item[1]))
         else:
-            pass
-
-    return np.dtype(list(flatten_descr(dtype.descr, prefix=prefix)))
+            descr.append((item_prefix + item[0], item[1]))
+    return np.dtype(descr)
 
 
 def flatten_field_names(dtype, prefix='', sep='_'):
@@ -26,12 +26,13 @@ def flatten(item):
     :return: A generator
     :rtype: generator[any]
     """
-    if isinstance(item, np.void) or isinstance(item, tuple):
-        for element in item:
-            for item in flatten(element):
-                yield item
-    else:
-        yield item
+    stack = [item]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, (np.void, tuple)):
+            stack.extend(reversed(tuple(item)))
+        else:
+            yield item
 
 
 if __name__ == "__main__":
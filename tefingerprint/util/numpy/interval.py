@@ -177,17 +177,15 @@ def length_of_contains(x, y, lower_field='start', upper_field='stop'):
         to array x
     :rtype: :class:`numpy.array`[int]
     """
+    # extract the bound columns and lengths of y once so each interval
+    # of x only masks a plain integer array
+    y_lower = y[lower_field]
+    y_upper = y[upper_field]
+    y_lengths = lengths(y, lower_field=lower_field, upper_field=upper_field)
     singles = zip(x[lower_field], x[upper_field])
-    masks = (singular_contains(l,
-                               u,
-                               y,
-                               y_lower_field=lower_field,
-                               y_upper_field=upper_field)
-             for l, u in singles)
-    return np.fromiter((np.sum(lengths(y[mask],
-                                       lower_field=lower_field,
-                                       upper_field=upper_field))
-                        for mask in masks),
+    return np.fromiter((np.sum(y_lengths[np.logical_and(l <= y_lower,
+                                                        y_upper <= u)])
+                        for l, u in singles),
                        dtype=np.int64,
                        count=len(x))
 